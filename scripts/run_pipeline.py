@@ -56,7 +56,7 @@ def main(args):
 
         # === CRITICAL: Data Quality Validation ===
         # This step is ESSENTIAL for production ML - validates data quality before training
-        print("🔍 Validating data quality with Great Expectations...")
+        print("🔍 Validating data quality...")
         is_valid, failed = validate_telco_data(df)
         mlflow.log_metric("data_quality_pass", int(is_valid))  # Track data quality over time
 
@@ -0,0 +1,157 @@
+# test_validate_data.py
+import io
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Make sure Python can find your src package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.utils.validate_data import (
+    _VALIDATION_CACHE,
+    validate_telco_csv,
+    validate_telco_data,
+)
+
+# === CONFIG ===
+N_ROWS = 2000
+CHUNKSIZE = 300  # small on purpose so checks span several chunk boundaries
+
+
+def make_frame(n: int = N_ROWS, seed: int = 0) -> pd.DataFrame:
+    """Synthetic Telco-shaped frame that passes every check."""
+    rng = np.random.default_rng(seed)
+    monthly = rng.uniform(20, 110, n).round(2)
+    tenure = rng.integers(1, 72, n)
+    total = (monthly * tenure).round(2).astype(str).astype(object)
+    total[:5] = " "  # blank TotalCharges, as in the raw dataset
+    return pd.DataFrame(
+        {
+            "customerID": [f"{i:04d}-ABCDE" for i in range(n)],
+            "gender": rng.choice(["Male", "Female"], n),
+            "SeniorCitizen": rng.integers(0, 2, n),
+            "Partner": rng.choice(["Yes", "No"], n),
+            "Dependents": rng.choice(["Yes", "No"], n),
+            "tenure": tenure,
+            "PhoneService": rng.choice(["Yes", "No"], n),
+            "InternetService": rng.choice(["DSL", "Fiber optic", "No"], n),
+            "Contract": rng.choice(["Month-to-month", "One year", "Two year"], n),
+            "MonthlyCharges": monthly,
+            "TotalCharges": total,
+            "Churn": rng.choice(["Yes", "No"], n),
+        }
+    )
+
+
+def with_edit(**cells) -> pd.DataFrame:
+    """Fresh valid frame with {column: {row: value}} edits applied."""
+    df = make_frame()
+    for col, edits in cells.items():
+        for row, value in edits.items():
+            df.loc[row, col] = value
+    return df
+
+
+def with_nullable_tenure() -> pd.DataFrame:
+    """Valid frame whose tenure is a nullable Int64 column holding one pd.NA."""
+    df = make_frame()
+    df["tenure"] = df["tenure"].astype("Int64")
+    df.loc[1400, "tenure"] = pd.NA
+    return df
+
+
+def arrow_backed() -> pd.DataFrame:
+    """Valid frame round-tripped through CSV into pyarrow-backed dtypes."""
+    return pd.read_csv(
+        io.StringIO(make_frame().to_csv(index=False)), dtype_backend="pyarrow"
+    )
+
+
+# (description, frame, expected failed checks)
+# Edits at rows >= CHUNKSIZE land in later chunks of the CSV run.
+CASES = [
+    ("valid frame with blank TotalCharges", make_frame(), []),
+    ("out-of-domain gender", with_edit(gender={1500: "X"}), ["gender_in_set"]),
+    ("null categorical is ignored", with_edit(Contract={700: None}), []),
+    ("null customerID", with_edit(customerID={1200: None}), ["customerID_not_null"]),
+    (
+        "duplicate customerID",
+        with_edit(customerID={1900: "0003-ABCDE"}),
+        ["customerID_unique"],
+    ),
+    (
+        "numeric-looking duplicate customerID across chunks",
+        with_edit(
+            customerID={**{i: str(i) for i in range(N_ROWS)}, 1998: "x", 1999: "5"}
+        ),
+        ["customerID_unique"],
+    ),
+    ("negative tenure", with_edit(tenure={650: -5}), ["tenure_nonneg", "tenure_range"]),
+    ("tenure above 120", with_edit(tenure={1000: 500}), ["tenure_range"]),
+    (
+        "MonthlyCharges above 200",
+        with_edit(MonthlyCharges={10: 250.0}),
+        ["MonthlyCharges_range"],
+    ),
+    (
+        "null MonthlyCharges",
+        with_edit(MonthlyCharges={1800: np.nan}),
+        ["MonthlyCharges_not_null"],
+    ),
+    (
+        "TotalCharges below MonthlyCharges for >5% of rows",
+        with_edit(TotalCharges={i: "1" for i in range(0, N_ROWS, 10)}),
+        ["TotalCharges_ge_MonthlyCharges"],
+    ),
+    ("nullable Int64 tenure with pd.NA", with_nullable_tenure(), ["tenure_not_null"]),
+    ("pyarrow-backed dtypes", arrow_backed(), []),
+    ("missing column", make_frame().drop(columns=["Contract"]), ["Contract_exists"]),
+]
+
+
+def check_cache():
+    """use_cache=True reuses an unchanged frame's result and misses after an edit."""
+    print("\n[cache] repeat validation, then edit a tail row")
+    _VALIDATION_CACHE.clear()
+    df = make_frame(n=5000)  # larger than the fingerprint's head+tail sample
+
+    first = validate_telco_data(df, use_cache=True)
+    second = validate_telco_data(df, use_cache=True)
+    assert first == second == (True, []), f"cache: {first} / {second}"
+    assert len(_VALIDATION_CACHE) == 1, "cache: second call did not hit"
+
+    df.loc[len(df) - 1, "tenure"] = 500
+    third = validate_telco_data(df, use_cache=True)
+    assert third == (False, ["tenure_range"]), f"cache: stale result {third}"
+    assert len(_VALIDATION_CACHE) == 2, "cache: edited frame did not miss"
+    _VALIDATION_CACHE.clear()
+
+
+def main():
+    print("=== Testing data validation: in-memory vs chunked CSV ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, (desc, df, expected) in enumerate(CASES, start=1):
+            print(f"\n[{i}] {desc}")
+            _VALIDATION_CACHE.clear()
+            path = os.path.join(tmp, f"case_{i}.csv")
+            df.to_csv(path, index=False)
+
+            is_valid, failed = validate_telco_data(df.copy())
+            assert is_valid == (not expected), f"{desc}: is_valid={is_valid}"
+            assert failed == expected, f"{desc}: {failed} != {expected}"
+
+            csv_valid, csv_failed = validate_telco_csv(path, chunksize=CHUNKSIZE)
+            assert csv_valid == is_valid, f"{desc}: chunked is_valid={csv_valid}"
+            assert csv_failed == failed, f"{desc}: chunked {csv_failed} != {failed}"
+
+    check_cache()
+
+    print(f"\n✅ All {len(CASES)} validation cases and the cache check passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,254 +1,259 @@
-import great_expectations as ge
+import sys
+import numpy as np
 import pandas as pd
-from typing import Tuple, List
-
-df = pd.read_csv(
-    "/Users/abhishekseth/Desktop/Development/Telco_ML_E2E/Telco-Customer-Churn-ML/data/raw/Telco-Customer-Churn.csv"
+from pandas.api.types import is_numeric_dtype
+from typing import Callable, Dict, Iterator, List, Tuple
+
+REQUIRED_COLUMNS = (
+    # Customer identifier (required for business operations)
+    "customerID",
+    # Core demographic features
+    "gender",
+    "Partner",
+    "Dependents",
+    # Service features (critical for churn analysis)
+    "PhoneService",
+    "InternetService",
+    "Contract",
+    # Financial features (key churn predictors)
+    "tenure",
+    "MonthlyCharges",
+    "TotalCharges",
 )
 
-
-def validate_telco_data(df) -> Tuple[bool, List[str]]:
+NUMERIC_COLUMNS = ("tenure", "MonthlyCharges", "TotalCharges")
+
+# No missing values in critical numeric features; (name, column)
+NOT_NULL_NUMERIC: List[Tuple[str, str]] = [
+    ("tenure_not_null", "tenure"),
+    ("MonthlyCharges_not_null", "MonthlyCharges"),
+]
+
+# Range checks are (name, column, min_value, max_value) and share one
+# per-column summary in _numeric_failures.
+RANGE_CHECKS: List[Tuple[str, str, float, float]] = [
+    # === NUMERIC RANGE VALIDATION ===
+    # Tenure must be non-negative (business logic - can't have negative tenure)
+    ("tenure_nonneg", "tenure", 0, np.inf),
+    # Monthly charges must be positive (business logic - no free service)
+    ("MonthlyCharges_nonneg", "MonthlyCharges", 0, np.inf),
+    # Total charges should be non-negative (business logic)
+    ("TotalCharges_nonneg", "TotalCharges", 0, np.inf),
+    # === STATISTICAL VALIDATION ===
+    # Tenure should be reasonable (max ~10 years = 120 months for telecom)
+    ("tenure_range", "tenure", 0, 120),
+    # Monthly charges should be within reasonable business range
+    ("MonthlyCharges_range", "MonthlyCharges", 0, 200),
+]
+
+# Results of recent validate_telco_data calls, keyed by _fingerprint(df)
+VALIDATION_CACHE_SIZE = 32
+FINGERPRINT_SAMPLE_ROWS = 1000
+_VALIDATION_CACHE: Dict[tuple, Tuple[bool, Tuple[str, ...], int]] = {}
+
+# Rows per block in the pair comparison; a 64 KiB mask stays cache-resident
+PAIR_BLOCK_SIZE = 1 << 16
+
+# Allowed values for low-cardinality categorical columns
+CATEGORICAL_DOMAINS = {
+    # Gender must be one of expected values (data integrity)
+    "gender": {"Male", "Female"},
+    # Yes/No fields must have valid values
+    "Partner": {"Yes", "No"},
+    "Dependents": {"Yes", "No"},
+    "PhoneService": {"Yes", "No"},
+    # Contract types must be valid (business constraint)
+    "Contract": {"Month-to-month", "One year", "Two year"},
+    # Internet service types (business constraint)
+    "InternetService": {"DSL", "Fiber optic", "No"},
+}
+
+# A check receives the frame plus the column arrays built once per validation
+# run by _coerce_columns and shared by all checks.
+Check = Callable[[pd.DataFrame, Dict[str, np.ndarray]], bool]
+
+
+def _coerce_columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
     """
-    Comprehensive data validation for Telco Customer Churn dataset using Great Expectations.
-
-    This function implements critical data quality checks that must pass before model training.
-    It validates data integrity, business logic constraints, and statistical properties
-    that the ML model expects.
-
+    Convert the checked columns to compact arrays once per run: float64 values
+    for NUMERIC_COLUMNS and the distinct non-null values of each
+    CATEGORICAL_DOMAINS column. The caller's frame is left untouched so
+    downstream feature engineering still sees object columns.
     """
-    print("🔍 Starting data validation with Great Expectations...")
-
-    # Convert pandas DataFrame to Great Expectations Dataset
-    # ge_df = ge.dataset.PandasDataset(df)
-
-    # Convert TotalCharges to numeric
-    df["TotalCharges"] = pd.to_numeric(df["TotalCharges"], errors="coerce")
-
-    context = ge.get_context()
-
-    # 4- Connect to data and create a Batch.
-    # Define a Data Source, Data Asset, Batch Definition, and Batch. The Pandas DataFrame is provided to the Batch Definition at runtime to create the Batch.
-    data_source = context.data_sources.add_pandas("pandas")
-    data_asset = data_source.add_dataframe_asset(name="telco_churn_data")
-
-    batch_definition = data_asset.add_batch_definition_whole_dataframe(
-        "telco_churn_data_whole_dataframe"
-    )
-    batch = batch_definition.get_batch(batch_parameters={"dataframe": df})
-
-    suite = context.suites.add(ge.ExpectationSuite(name="telco_churn_data_suite"))
-    validation_definition = ge.ValidationDefinition(
-        data=batch_definition, suite=suite, name="telco_churn_data_validation"
-    )
-
-    # === SCHEMA VALIDATION - ESSENTIAL COLUMNS ===
-    print("   📋 Validating schema and required columns...")
-
-    # # Customer identifier must exist (required for business operations)
-    # ge_df.expect_column_to_exist("customerID")
-    # ge_df.expect_column_values_to_not_be_null("customerID")
-
-    expectation1 = ge.expectations.ExpectColumnToExist(column="customerID")
-    expectation2 = ge.expectations.ExpectColumnValuesToNotBeNull(column="customerID")
-
-    # # Core demographic features
-    # ge_df.expect_column_to_exist("gender")
-    # ge_df.expect_column_to_exist("Partner")
-    # ge_df.expect_column_to_exist("Dependents")
+    cols = {}
+    for c in NUMERIC_COLUMNS:
+        values = (
+            df[c] if is_numeric_dtype(df[c]) else pd.to_numeric(df[c], errors="coerce")
+        )
+        # na_value covers nullable/Arrow dtypes, whose NA cannot cast to float directly
+        cols[c] = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    for c in CATEGORICAL_DOMAINS:
+        # factorize hashes the strings once into int codes plus the k uniques
+        # (nulls get no unique), so the domain check only compares k values
+        _, cols[c] = pd.factorize(df[c].to_numpy())
+    return cols
 
-    expectation3 = ge.expectations.ExpectColumnToExist(column="gender")
-    expectation4 = ge.expectations.ExpectColumnToExist(column="Partner")
-    expectation5 = ge.expectations.ExpectColumnToExist(column="Dependents")
 
-    # # Service features (critical for churn analysis)
-    # ge_df.expect_column_to_exist("PhoneService")
-    # ge_df.expect_column_to_exist("InternetService")
-    # ge_df.expect_column_to_exist("Contract")
+def _not_null(column: str) -> Check:
+    # isna on the raw object array skips the Series wrapper
+    return lambda d, cols: not pd.isna(d[column].to_numpy()).any()
 
-    expectation6 = ge.expectations.ExpectColumnToExist(column="PhoneService")
-    expectation7 = ge.expectations.ExpectColumnToExist(column="InternetService")
-    expectation8 = ge.expectations.ExpectColumnToExist(column="Contract")
 
-    # # Financial features (key churn predictors)
-    # ge_df.expect_column_to_exist("tenure")
-    # ge_df.expect_column_to_exist("MonthlyCharges")
-    # ge_df.expect_column_to_exist("TotalCharges")
+def _unique(column: str) -> Check:
+    # One hash-table build; nulls count as a value, so repeated nulls are duplicates
+    return lambda d, cols: d[column].nunique(dropna=False) == len(d)
 
-    expectation9 = ge.expectations.ExpectColumnToExist(column="tenure")
-    expectation10 = ge.expectations.ExpectColumnToExist(column="MonthlyCharges")
-    expectation11 = ge.expectations.ExpectColumnToExist(column="TotalCharges")
 
-    # # === BUSINESS LOGIC VALIDATION ===
-    print("   💼 Validating business logic constraints...")
+def _in_set(column: str, allowed: set) -> Check:
+    # cols holds only the distinct non-null values, so nulls are ignored,
+    # matching ExpectColumnDistinctValuesToBeInSet.
+    return lambda d, cols: allowed.issuperset(cols[column])
 
-    # # Gender must be one of expected values (data integrity)
-    # ge_df.expect_column_values_to_be_in_set("gender", ["Male", "Female"])
 
-    expectation12 = ge.expectations.ExpectColumnDistinctValuesToBeInSet(
-        column="gender", value_set=["Male", "Female"]
-    )
+def _column_summary(a: np.ndarray) -> Tuple[bool, float, float]:
+    """
+    Null flag, min and max of one numeric array in as few fused passes as possible.
 
-    # # Yes/No fields must have valid values
-    # ge_df.expect_column_values_to_be_in_set("Partner", ["Yes", "No"])
-    # ge_df.expect_column_values_to_be_in_set("Dependents", ["Yes", "No"])
-    # ge_df.expect_column_values_to_be_in_set("PhoneService", ["Yes", "No"])
+    np.minimum propagates NaN, so a single reduction both detects nulls and, for
+    the common null-free column, yields the min without an N-byte isnan mask.
+    Only columns with nulls pay a second NaN-skipping fmin pass. Nulls are
+    ignored by range checks as in ExpectColumnValuesToBeBetween; an empty or
+    all-null column passes vacuously.
+    """
+    col_min = np.minimum.reduce(a, initial=np.inf)
+    has_null = bool(np.isnan(col_min))
+    if has_null:
+        col_min = np.fmin.reduce(a, initial=np.inf)
+        col_max = np.fmax.reduce(a, initial=-np.inf)
+    else:
+        col_max = np.maximum.reduce(a, initial=-np.inf)
+    return has_null, col_min, col_max
 
-    expectation13 = ge.expectations.ExpectColumnDistinctValuesToBeInSet(
-        column="Partner", value_set=["Yes", "No"]
-    )
-    expectation14 = ge.expectations.ExpectColumnDistinctValuesToBeInSet(
-        column="Dependents", value_set=["Yes", "No"]
-    )
-    expectation15 = ge.expectations.ExpectColumnDistinctValuesToBeInSet(
-        column="PhoneService", value_set=["Yes", "No"]
-    )
 
-    # # Contract types must be valid (business constraint)
-    # ge_df.expect_column_values_to_be_in_set(
-    #     "Contract", ["Month-to-month", "One year", "Two year"]
-    # )
+def _numeric_failures(cols: Dict[str, np.ndarray]) -> List[str]:
+    """
+    Evaluate the numeric not-null checks and RANGE_CHECKS from one summary per
+    column, so every check is a scalar comparison.
+    """
+    summary = {c: _column_summary(cols[c]) for c in NUMERIC_COLUMNS}
 
-    expectation16 = ge.expectations.ExpectColumnDistinctValuesToBeInSet(
-        column="Contract", value_set=["Month-to-month", "One year", "Two year"]
-    )
+    failed = [name for name, column in NOT_NULL_NUMERIC if summary[column][0]]
+    for name, column, lo, hi in RANGE_CHECKS:
+        _, col_min, col_max = summary[column]
+        if col_min < lo or col_max > hi:
+            failed.append(name)
+    return failed
 
-    # # Internet service types (business constraint)
-    # ge_df.expect_column_values_to_be_in_set(
-    #     "InternetService", ["DSL", "Fiber optic", "No"]
-    # )
 
-    expectation17 = ge.expectations.ExpectColumnDistinctValuesToBeInSet(
-        column="InternetService", value_set=["DSL", "Fiber optic", "No"]
-    )
+def _pair_pass_count(cols: Dict[str, np.ndarray], column_a: str, column_b: str) -> int:
+    """
+    Number of rows where column_a >= column_b (rows with a null never pass).
 
-    # # === NUMERIC RANGE VALIDATION ===
-    print("   📊 Validating numeric ranges and business constraints...")
+    Compares in PAIR_BLOCK_SIZE blocks into one reused mask, so the check is a
+    single stream over both float arrays without an N-byte temporary.
+    """
+    a, b = cols[column_a], cols[column_b]
+    mask = np.empty(min(len(a), PAIR_BLOCK_SIZE), dtype=bool)
+    passes = 0
+    for start in range(0, len(a), PAIR_BLOCK_SIZE):
+        block = mask[: min(PAIR_BLOCK_SIZE, len(a) - start)]
+        np.greater_equal(
+            a[start : start + len(block)], b[start : start + len(block)], out=block
+        )
+        passes += np.count_nonzero(block)
+    return passes
+
+
+# Each check is (name, predicate).
+DOMAIN_CHECKS: List[Tuple[str, Check]] = [
+    # Customer identifier must be populated (required for business operations)
+    ("customerID_not_null", _not_null("customerID")),
+    # Customer identifier is a business key and must not repeat
+    ("customerID_unique", _unique("customerID")),
+    # Categorical fields must only contain values from CATEGORICAL_DOMAINS
+    *[
+        (f"{col}_in_set", _in_set(col, allowed))
+        for col, allowed in CATEGORICAL_DOMAINS.items()
+    ],
+]
+
+# === DATA CONSISTENCY CHECKS ===
+# Total charges should generally be >= Monthly charges (except for very new customers).
+# (name, column_A, column_B, mostly); allow 5% exceptions for edge cases. Kept as pass
+# counts rather than a predicate so chunked validation can sum them across chunks.
+PAIR_CHECK: Tuple[str, str, str, float] = (
+    "TotalCharges_ge_MonthlyCharges",
+    "TotalCharges",
+    "MonthlyCharges",
+    0.95,
+)
 
-    # # Tenure must be non-negative (business logic - can't have negative tenure)
-    # ge_df.expect_column_values_to_be_between("tenure", min_value=0)
+# Tier 3 check names in reporting order
+STATISTICAL_CHECK_NAMES = (
+    *[name for name, _ in NOT_NULL_NUMERIC],
+    *[name for name, *_ in RANGE_CHECKS],
+    PAIR_CHECK[0],
+)
 
-    expectation18 = ge.expectations.ExpectColumnValuesToBeBetween(
-        column="tenure", min_value=0
-    )
 
-    # # Monthly charges must be positive (business logic - no free service)
-    # ge_df.expect_column_values_to_be_between("MonthlyCharges", min_value=0)
+def _iter_failures(
+    checks: List[Tuple[str, Check]], df: pd.DataFrame, cols: Dict[str, np.ndarray]
+) -> Iterator[str]:
+    """Evaluate (name, check) pairs lazily and yield the names of the failing ones."""
+    for name, check in checks:
+        if not check(df, cols):
+            yield name
 
-    expectation19 = ge.expectations.ExpectColumnValuesToBeBetween(
-        column="MonthlyCharges", min_value=0
-    )
 
-    # # Total charges should be non-negative (business logic)
-    # ge_df.expect_column_values_to_be_between("TotalCharges", min_value=0)
+def _check_schema(df: pd.DataFrame) -> Tuple[bool, List[str]]:
+    """Tier 1: every column in REQUIRED_COLUMNS must exist."""
+    failed = [f"{c}_exists" for c in REQUIRED_COLUMNS if c not in df.columns]
+    return not failed, failed
 
-    expectation20 = ge.expectations.ExpectColumnValuesToBeBetween(
-        column="TotalCharges", min_value=0
-    )
 
-    # # === STATISTICAL VALIDATION ===
-    print("   📈 Validating statistical properties...")
+def _check_domains(
+    df: pd.DataFrame, cols: Dict[str, np.ndarray]
+) -> Tuple[bool, List[str]]:
+    """Tier 2: identifier presence and uniqueness, and categorical value domains."""
+    failed = list(_iter_failures(DOMAIN_CHECKS, df, cols))
+    return not failed, failed
 
-    # # Tenure should be reasonable (max ~10 years = 120 months for telecom)
-    # ge_df.expect_column_values_to_be_between("tenure", min_value=0, max_value=120)
 
-    expectation21 = ge.expectations.ExpectColumnValuesToBeBetween(
-        column="tenure", min_value=0, max_value=120
-    )
+def _check_statistics(
+    df: pd.DataFrame, cols: Dict[str, np.ndarray]
+) -> Tuple[bool, List[str]]:
+    """Tier 3: numeric nulls, ranges and the TotalCharges/MonthlyCharges pair."""
+    failed = _numeric_failures(cols)
+    name, column_a, column_b, mostly = PAIR_CHECK
+    if _pair_pass_count(cols, column_a, column_b) < mostly * len(df):
+        failed.append(name)
+    return not failed, failed
 
-    # # Monthly charges should be within reasonable business range
-    # ge_df.expect_column_values_to_be_between(
-    #     "MonthlyCharges", min_value=0, max_value=200
-    # )
 
-    expectation22 = ge.expectations.ExpectColumnValuesToBeBetween(
-        column="MonthlyCharges", min_value=0, max_value=200
+def _fingerprint(df: pd.DataFrame) -> tuple:
+    """
+    Cheap identity for a frame: shape, columns, dtypes and a hash of the first
+    and last FINGERPRINT_SAMPLE_ROWS rows. Edits confined to the middle of a
+    large frame that keep its shape and dtypes are not detected, which is why
+    validate_telco_data only consults the cache when use_cache=True.
+    """
+    n = FINGERPRINT_SAMPLE_ROWS
+    sample = df if len(df) <= 2 * n else pd.concat([df.head(n), df.tail(n)])
+    return (
+        df.shape,
+        tuple(df.columns),
+        tuple(df.dtypes.astype(str)),
+        int(pd.util.hash_pandas_object(sample, index=False).sum()),
     )
 
-    # # No missing values in critical numeric features
-    # ge_df.expect_column_values_to_not_be_null("tenure")
-    # ge_df.expect_column_values_to_not_be_null("MonthlyCharges")
-
-    expectation23 = ge.expectations.ExpectColumnValuesToNotBeNull(column="tenure")
-    expectation24 = ge.expectations.ExpectColumnValuesToNotBeNull(
-        column="MonthlyCharges"
-    )
 
-    # # === DATA CONSISTENCY CHECKS ===
-    print("   🔗 Validating data consistency...")
-
-    # # Total charges should generally be >= Monthly charges (except for very new customers)
-    # # This is a business logic check to catch data entry errors
-    # ge_df.expect_column_pair_values_A_to_be_greater_than_B(
-    #     column_A="TotalCharges",
-    #     column_B="MonthlyCharges",
-    #     or_equal=True,
-    #     mostly=0.95,  # Allow 5% exceptions for edge cases
-    # )
-
-    expectation25 = ge.expectations.ExpectColumnPairValuesAToBeGreaterThanB(
-        column_A="TotalCharges",
-        column_B="MonthlyCharges",
-        or_equal=True,
-        mostly=0.95,  # Allow 5% exceptions for edge cases
-    )
+def _print_summary(
+    is_valid: bool, failed_expectations: List[str], total_checks: int
+) -> None:
+    failed_checks = len(failed_expectations)
+    passed_checks = total_checks - failed_checks
 
-    ## Adding the expectations to the suite
-    suite.add_expectation(expectation1)
-    suite.add_expectation(expectation2)
-    suite.add_expectation(expectation3)
-    suite.add_expectation(expectation4)
-    suite.add_expectation(expectation5)
-    suite.add_expectation(expectation6)
-    suite.add_expectation(expectation7)
-    suite.add_expectation(expectation8)
-    suite.add_expectation(expectation9)
-    suite.add_expectation(expectation10)
-    suite.add_expectation(expectation11)
-    suite.add_expectation(expectation12)
-    suite.add_expectation(expectation13)
-    suite.add_expectation(expectation14)
-    suite.add_expectation(expectation15)
-    suite.add_expectation(expectation16)
-    suite.add_expectation(expectation17)
-    suite.add_expectation(expectation18)
-    suite.add_expectation(expectation19)
-    suite.add_expectation(expectation20)
-    suite.add_expectation(expectation21)
-    suite.add_expectation(expectation22)
-    suite.add_expectation(expectation23)
-    suite.add_expectation(expectation24)
-    suite.add_expectation(expectation25)
-
-    # # === RUN VALIDATION SUITE ===
-    print("   ⚙️  Running complete validation suite...")
-    # results = ge_df.validate()
-
-    results = batch.validate(suite)
-
-    # # === PROCESS RESULTS ===
-    # # Extract failed expectations for detailed error reporting
-    # failed_expectations = []
-    # for r in results["results"]:
-    #     if not r["success"]:
-    #         expectation_type = r["expectation_config"]["expectation_type"]
-    #         failed_expectations.append(expectation_type)
-
-    failed_expectations = []
-    for r in results["results"][0:]:
-        if not r["success"]:
-            failed_expectations.append(r["expectation_config"]["type"])
-            # failed_expectations.append(
-            #     r["expectation_config"]["type"]
-            #     + ": "
-            #     + str(r["expectation_config"]["kwargs"]["column"])
-            # )
-
-    # # Print validation summary
-    total_checks = len(results["results"])
-    passed_checks = sum(1 for r in results["results"][0:] if r["success"])
-    failed_checks = total_checks - passed_checks
-
-    if results["success"]:
+    if is_valid:
         print(
             f"✅ Data validation PASSED: {passed_checks}/{total_checks} checks successful"
         )
@@ -258,136 +263,148 @@ def validate_telco_data(df) -> Tuple[bool, List[str]]:
         )
         print(f"   Failed expectations: {failed_expectations}")
 
-    return results["success"], failed_expectations
-
-
-#########################################################################################################################
-# import great_expectations as ge
-# from typing import Tuple, List
-
-
-# def validate_telco_data(df) -> Tuple[bool, List[str]]:
-#     """
-#     Comprehensive data validation for Telco Customer Churn dataset using Great Expectations.
 
-#     This function implements critical data quality checks that must pass before model training.
-#     It validates data integrity, business logic constraints, and statistical properties
-#     that the ML model expects.
-
-#     """
-#     print("🔍 Starting data validation with Great Expectations...")
-
-#     # Convert pandas DataFrame to Great Expectations Dataset
-#     # ge_df = ge.dataset.PandasDataset(df)
-#     ge_df = ge.from_pandas(df)
-
-#     # === SCHEMA VALIDATION - ESSENTIAL COLUMNS ===
-#     print("   📋 Validating schema and required columns...")
-
-#     # Customer identifier must exist (required for business operations)
-#     ge_df.expect_column_to_exist("customerID")
-#     ge_df.expect_column_values_to_not_be_null("customerID")
-
-#     # Core demographic features
-#     ge_df.expect_column_to_exist("gender")
-#     ge_df.expect_column_to_exist("Partner")
-#     ge_df.expect_column_to_exist("Dependents")
-
-#     # Service features (critical for churn analysis)
-#     ge_df.expect_column_to_exist("PhoneService")
-#     ge_df.expect_column_to_exist("InternetService")
-#     ge_df.expect_column_to_exist("Contract")
+def validate_telco_data(df, use_cache: bool = False) -> Tuple[bool, List[str]]:
+    """
+    Comprehensive data validation for Telco Customer Churn dataset.
 
-#     # Financial features (key churn predictors)
-#     ge_df.expect_column_to_exist("tenure")
-#     ge_df.expect_column_to_exist("MonthlyCharges")
-#     ge_df.expect_column_to_exist("TotalCharges")
+    This function implements critical data quality checks that must pass before model training.
+    It validates data integrity, business logic constraints, and statistical properties
+    that the ML model expects. Each check is a vectorized pandas/NumPy expression.
 
-#     # === BUSINESS LOGIC VALIDATION ===
-#     print("   💼 Validating business logic constraints...")
+    Checks run in three tiers (schema -> domain -> statistical) and stop at the
+    first tier that fails, so later tiers never run against missing or malformed
+    columns.
 
-#     # Gender must be one of expected values (data integrity)
-#     ge_df.expect_column_values_to_be_in_set("gender", ["Male", "Female"])
+    Pass use_cache=True only in loops that re-validate the same, unmodified frame
+    (e.g. hyperparameter sweeps): results are then keyed on a sampled fingerprint
+    (see _fingerprint) and a hit skips the scan. The cache is off by default because
+    the fingerprint cannot see edits in the middle of a frame, so a quality gate
+    could otherwise return a stale PASS.
 
-#     # Yes/No fields must have valid values
-#     ge_df.expect_column_values_to_be_in_set("Partner", ["Yes", "No"])
-#     ge_df.expect_column_values_to_be_in_set("Dependents", ["Yes", "No"])
-#     ge_df.expect_column_values_to_be_in_set("PhoneService", ["Yes", "No"])
+    """
+    print("🔍 Starting data validation...")
 
-#     # Contract types must be valid (business constraint)
-#     ge_df.expect_column_values_to_be_in_set(
-#         "Contract", ["Month-to-month", "One year", "Two year"]
-#     )
+    # Convert TotalCharges to numeric (skipped when a loader or earlier run already did)
+    if "TotalCharges" in df.columns and not is_numeric_dtype(df["TotalCharges"]):
+        df["TotalCharges"] = pd.to_numeric(df["TotalCharges"], errors="coerce")
 
-#     # Internet service types (business constraint)
-#     ge_df.expect_column_values_to_be_in_set(
-#         "InternetService", ["DSL", "Fiber optic", "No"]
-#     )
+    # Fingerprint after coercion so a re-run on the same frame hits the cache
+    key = _fingerprint(df) if use_cache else None
+    if key in _VALIDATION_CACHE:
+        is_valid, failed, total_checks = _VALIDATION_CACHE[key]
+        print("   ♻️  Frame unchanged since a previous validation, reusing result")
+        _print_summary(is_valid, list(failed), total_checks)
+        return is_valid, list(failed)
 
-#     # === NUMERIC RANGE VALIDATION ===
-#     print("   📊 Validating numeric ranges and business constraints...")
+    # === SCHEMA VALIDATION - ESSENTIAL COLUMNS ===
+    print("   📋 Validating schema and required columns...")
+    is_valid, failed_expectations = _check_schema(df)
+    total_checks = len(REQUIRED_COLUMNS)
 
-#     # Tenure must be non-negative (business logic - can't have negative tenure)
-#     ge_df.expect_column_values_to_be_between("tenure", min_value=0)
+    if is_valid:
+        # Coerce checked columns once; every check reuses these arrays
+        cols = _coerce_columns(df)
 
-#     # Monthly charges must be positive (business logic - no free service)
-#     ge_df.expect_column_values_to_be_between("MonthlyCharges", min_value=0)
+        with np.errstate(invalid="ignore"):
+            # === BUSINESS LOGIC VALIDATION ===
+            print("   💼 Validating business logic constraints...")
+            is_valid, failed_expectations = _check_domains(df, cols)
+            total_checks += len(DOMAIN_CHECKS)
 
-#     # Total charges should be non-negative (business logic)
-#     ge_df.expect_column_values_to_be_between("TotalCharges", min_value=0)
+            if is_valid:
+                # === STATISTICAL VALIDATION ===
+                print("   📈 Validating numeric ranges and statistical properties...")
+                is_valid, failed_expectations = _check_statistics(df, cols)
+                total_checks += len(STATISTICAL_CHECK_NAMES)
 
-#     # === STATISTICAL VALIDATION ===
-#     print("   📈 Validating statistical properties...")
+    if use_cache:
+        if len(_VALIDATION_CACHE) >= VALIDATION_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _VALIDATION_CACHE[next(iter(_VALIDATION_CACHE))]
+        _VALIDATION_CACHE[key] = (is_valid, tuple(failed_expectations), total_checks)
 
-#     # Tenure should be reasonable (max ~10 years = 120 months for telecom)
-#     ge_df.expect_column_values_to_be_between("tenure", min_value=0, max_value=120)
+    _print_summary(is_valid, failed_expectations, total_checks)
+    return is_valid, failed_expectations
 
-#     # Monthly charges should be within reasonable business range
-#     ge_df.expect_column_values_to_be_between(
-#         "MonthlyCharges", min_value=0, max_value=200
-#     )
 
-#     # No missing values in critical numeric features
-#     ge_df.expect_column_values_to_not_be_null("tenure")
-#     ge_df.expect_column_values_to_not_be_null("MonthlyCharges")
+def validate_telco_csv(path: str, chunksize: int = 100_000) -> Tuple[bool, List[str]]:
+    """
+    Validate a Telco CSV chunk by chunk without loading the whole file.
 
-#     # === DATA CONSISTENCY CHECKS ===
-#     print("   🔗 Validating data consistency...")
+    Runs the same tiers as validate_telco_data on running aggregates. Null, domain
+    and range checks hold for the file if they hold for every chunk, and the
+    TotalCharges/MonthlyCharges pair check sums pass counts, so the frame itself
+    is bounded by chunksize. customerID uniqueness is checked once over the whole
+    file on 8-byte hashes of the IDs, so memory still grows by 8 bytes per row.
+    A hash collision between two distinct IDs would report a false duplicate,
+    which is vanishingly rare at 64 bits.
 
-#     # Total charges should generally be >= Monthly charges (except for very new customers)
-#     # This is a business logic check to catch data entry errors
-#     ge_df.expect_column_pair_values_A_to_be_greater_than_B(
-#         column_A="TotalCharges",
-#         column_B="MonthlyCharges",
-#         or_equal=True,
-#         mostly=0.95,  # Allow 5% exceptions for edge cases
-#     )
-
-#     # === RUN VALIDATION SUITE ===
-#     print("   ⚙️  Running complete validation suite...")
-#     results = ge_df.validate()
-
-#     # === PROCESS RESULTS ===
-#     # Extract failed expectations for detailed error reporting
-#     failed_expectations = []
-#     for r in results["results"]:
-#         if not r["success"]:
-#             expectation_type = r["expectation_config"]["expectation_type"]
-#             failed_expectations.append(expectation_type)
-
-#     # Print validation summary
-#     total_checks = len(results["results"])
-#     passed_checks = sum(1 for r in results["results"] if r["success"])
-#     failed_checks = total_checks - passed_checks
-
-#     if results["success"]:
-#         print(
-#             f"✅ Data validation PASSED: {passed_checks}/{total_checks} checks successful"
-#         )
-#     else:
-#         print(
-#             f"❌ Data validation FAILED: {failed_checks}/{total_checks} checks failed"
-#         )
-#         print(f"   Failed expectations: {failed_expectations}")
-
-#     return results["success"], failed_expectations
+    """
+    print(f"🔍 Starting chunked data validation (chunksize={chunksize})...")
+
+    domain_failed, stats_failed = set(), set()
+    pair_name, column_a, column_b, mostly = PAIR_CHECK
+    pair_passes = rows = 0
+    id_hashes = []
+    # Uniqueness is checked across the whole file below, not per chunk
+    chunk_domain_checks = [c for c in DOMAIN_CHECKS if c[0] != "customerID_unique"]
+
+    # Read IDs as strings: per-chunk type inference could otherwise parse the same
+    # ID as int in one chunk and str in another, and the two hash differently
+    with pd.read_csv(path, chunksize=chunksize, dtype={"customerID": str}) as reader:
+        for i, chunk in enumerate(reader):
+            if i == 0:
+                # === SCHEMA VALIDATION - ESSENTIAL COLUMNS ===
+                print("   📋 Validating schema and required columns...")
+                is_valid, failed_expectations = _check_schema(chunk)
+                if not is_valid:
+                    _print_summary(is_valid, failed_expectations, len(REQUIRED_COLUMNS))
+                    return is_valid, failed_expectations
+                print("   📊 Accumulating domain and statistical checks per chunk...")
+
+            cols = _coerce_columns(chunk)
+            with np.errstate(invalid="ignore"):
+                domain_failed.update(_iter_failures(chunk_domain_checks, chunk, cols))
+                # Tier 3 is never reported after a domain failure, so stop scanning
+                if not domain_failed:
+                    stats_failed.update(_numeric_failures(cols))
+                    pair_passes += _pair_pass_count(cols, column_a, column_b)
+                    rows += len(chunk)
+            id_hashes.append(pd.util.hash_array(chunk["customerID"].to_numpy()))
+
+    ids = np.concatenate(id_hashes)
+    if len(np.unique(ids)) != len(ids):
+        domain_failed.add("customerID_unique")
+
+    if pair_passes < mostly * rows:
+        stats_failed.add(pair_name)
+
+    # Report in check-table order and stop at the first failing tier
+    total_checks = len(REQUIRED_COLUMNS) + len(DOMAIN_CHECKS)
+    failed_expectations = [name for name, _ in DOMAIN_CHECKS if name in domain_failed]
+    if not failed_expectations:
+        total_checks += len(STATISTICAL_CHECK_NAMES)
+        failed_expectations = [
+            name for name in STATISTICAL_CHECK_NAMES if name in stats_failed
+        ]
+
+    is_valid = not failed_expectations
+    _print_summary(is_valid, failed_expectations, total_checks)
+    return is_valid, failed_expectations
+
+
+def _load(path: str) -> pd.DataFrame:
+    """Read a CSV with pandas' multithreaded PyArrow parser."""
+    return pd.read_csv(path, engine="pyarrow")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print(
+            "Usage: python src/utils/validate_data.py "
+            "<path/to/Telco-Customer-Churn.csv>"
+        )
+        sys.exit(2)
+    is_valid, _ = validate_telco_data(_load(sys.argv[1]))
+    sys.exit(0 if is_valid else 1)